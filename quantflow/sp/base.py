@@ -49,7 +49,14 @@ class StochasticProcess(BaseModel, ABC, extra="forbid"):
 
         :param t: time horizon
         :param u: characteristic function input parameter
+
+        When `u` is in single precision, so is the time horizon, otherwise
+        functions of a scalar time horizon would promote the whole computation
+        to double precision.
         """
+        dtype = np.result_type(np.real(u), 1.0)
+        if dtype.itemsize < 8:
+            t = np.asarray(t, dtype=dtype)
         return np.exp(-self.characteristic_exponent(t, u))
 
     def convexity_correction(self, t: FloatArrayLike) -> Vector:
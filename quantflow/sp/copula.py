@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from math import isclose
+from functools import lru_cache
 
 import numpy as np
 from pydantic import BaseModel, Field
@@ -63,6 +63,11 @@ class IndependentCopula(Copula):
         return np.array([v, u])
 
 
+_SMALL_KAPPA = 1e-3
+"""Below this absolute value of kappa the Frank copula and its jacobian use a
+third order expansion around the independence copula"""
+
+
 class FrankCopula(Copula):
     r"""
     Frank Copula with parameter :math:`\kappa`
@@ -78,40 +83,78 @@ class FrankCopula(Copula):
 
     def __call__(self, u: FloatArrayLike, v: FloatArrayLike) -> FloatArrayLike:
         k = float(self.kappa)
-        if isclose(k, 0.0):
-            return u * v
-        eu = np.exp(-k * u)
-        ev = np.exp(-k * v)
-        e = np.exp(-k)
-        return -np.log(1 + (eu - 1) * (ev - 1) / (e - 1)) / k
+        if abs(k) < _SMALL_KAPPA:
+            # third order expansion around the independence copula
+            a, b = u * (1 - u), v * (1 - v)
+            s = 1 + k * (1 - 2 * u) * (1 - 2 * v) / 6 + k * k * (6 * a * b - a - b) / 12
+            return u * v + 0.5 * k * a * b * s
+        _, _, _, x = self._kernel(k, u, v)
+        return -np.log1p(x) / k
 
     def tau(self) -> float:
         """Kendall's tau"""
-        k = float(self.kappa)
-        if isclose(k, 0.0):
-            return 0
-        return 1 + 4 * (debye(1, k) - 1) / k
+        return _frank_tau(float(self.kappa))
 
     def rho(self) -> float:
         """Spearman's rho"""
-        k = float(self.kappa)
-        if isclose(k, 0.0):
-            return 0
-        return 1 - 12 * (debye(2, -k) - debye(1, -k)) / k
+        return _frank_rho(float(self.kappa))
 
     def jacobian(self, u: FloatArrayLike, v: FloatArrayLike) -> FloatArray:
         k = float(self.kappa)
-        if isclose(k, 0.0):
-            return np.array([v, u, v * 0])
-        eu = np.exp(-k * u)
-        ev = np.exp(-k * v)
-        e = np.exp(-k)
-        x = (eu - 1) * (ev - 1) / (e - 1)
-        c = -np.log(1 + x) / k
+        if abs(k) < _SMALL_KAPPA:
+            # derivatives of the third order expansion used by the copula,
+            # uv + k q (1 + k c / 6 + k^2 d / 12)
+            a, b = u * (1 - u), v * (1 - v)
+            au, bv = 1 - 2 * u, 1 - 2 * v
+            q = 0.5 * a * b
+            c = au * bv
+            d = 6 * a * b - a - b
+            s = 1 + k * c / 6 + k * k * d / 12
+            du = v + k * (
+                0.5 * b * au * s + k * q * ((6 * b - 1) * au * k / 12 - bv / 3)
+            )
+            dv = u + k * (
+                0.5 * a * bv * s + k * q * ((6 * a - 1) * bv * k / 12 - au / 3)
+            )
+            return np.array([du, dv, q * (1 + k * c / 3 + k * k * d / 4)])
+        em1u, em1v, em1, x = self._kernel(k, u, v)
+        c = -np.log1p(x) / k
         xx = x / (1 + x)
-        du = eu * (ev - 1) / (e - 1) / (1 + x)
-        # du = eu * xx / (eu - 1)
-        dv = eu * (eu - 1) / (e - 1) / (1 + x)
-        # dv = ev * xx / (ev - 1)
-        dk = (u * du + v * dv - e * xx / (e - 1) - c) / k
+        d = em1 * (1 + x)
+        du = (1 + em1u) * em1v / d
+        dv = (1 + em1v) * em1u / d
+        dk = (u * du + v * dv - (1 + em1) * xx / em1 - c) / k
         return np.array([du, dv, dk])
+
+    def _kernel(
+        self, k: float, u: FloatArrayLike, v: FloatArrayLike
+    ) -> tuple[FloatArrayLike, FloatArrayLike, float, FloatArrayLike]:
+        """Exponentials shared by the copula and its jacobian
+
+        ``expm1`` keeps full precision when ``k*u``, ``k*v`` or ``k`` are small
+        """
+        em1u = np.expm1(-k * u)
+        em1v = np.expm1(-k * v)
+        em1 = np.expm1(-k)
+        x = em1u * em1v / em1
+        return em1u, em1v, em1, x
+
+
+# tau and rho use series expansions for small k, where the quadrature of the
+# Debye functions loses precision
+
+
+@lru_cache(maxsize=1024)
+def _frank_tau(k: float) -> float:
+    """Kendall's tau of the Frank copula, cached since it requires quadrature"""
+    if abs(k) < 1e-2:
+        return k * (1 / 9 - k * k / 900)
+    return 1 + 4 * (debye(1, k) - 1) / k
+
+
+@lru_cache(maxsize=1024)
+def _frank_rho(k: float) -> float:
+    """Spearman's rho of the Frank copula, cached since it requires quadrature"""
+    if abs(k) < 1e-2:
+        return k * (1 / 6 - k * k / 450)
+    return 1 - 12 * (debye(1, k) - debye(2, k)) / k
@@ -4,10 +4,14 @@ import numpy as np
 from pydantic import Field
 from scipy.optimize import Bounds
 
-from ..utils.types import FloatArray, FloatArrayLike, Vector
-from .base import StochasticProcess1DMarginal
+from ..utils.types import FloatArray, FloatArrayLike, IntArray, Vector
 from .cir import CIR, IntensityProcess
-from .poisson import MarginalDiscrete1D, PoissonBase, PoissonProcess, poisson_arrivals
+from .poisson import (
+    MarginalDiscrete1D,
+    PoissonBase,
+    PoissonProcess,
+    poisson_arrivals_batch,
+)
 
 
 class DSP(PoissonBase):
@@ -25,7 +29,7 @@ class DSP(PoissonBase):
     )
     poisson: PoissonProcess = Field(default_factory=PoissonProcess, exclude=True)
 
-    def marginal(self, t: FloatArrayLike) -> StochasticProcess1DMarginal:
+    def marginal(self, t: FloatArrayLike) -> MarginalDiscrete1D:
         return MarginalDiscrete1D(process=self, t=t)
 
     def frequency_range(self, std: float, max_frequency: float | None = None) -> Bounds:
@@ -36,13 +40,31 @@ class DSP(PoissonBase):
         return np.linspace(0, points, points + 1)
 
     def characteristic_exponent(self, t: FloatArrayLike, u: Vector) -> Vector:
-        phi = self.poisson.characteristic_exponent(t, u)
+        # the Poisson process runs on the cumulative intensity clock
+        phi = self.poisson.characteristic_exponent(1, u)
         return -self.intensity.integrated_log_laplace(t, phi)
 
-    def arrivals(self, t: float = 1) -> list[float]:
-        paths = self.intensity.sample(1, t, math.ceil(100 * t)).integrate()
-        intensity = paths.data[-1, 0]
-        return poisson_arrivals(intensity, t)
+    def arrivals(self, t: float = 1) -> FloatArray:
+        return self.arrivals_batch(t, 1)[0]
+
+    def arrivals_batch(
+        self, time_horizon: float = 1, m: int = 1
+    ) -> tuple[FloatArray, IntArray]:
+        """Generate jump arrivals times up to `time_horizon` for `m` independent paths
+
+        The intensity paths are sampled in one vectorized call, so drawing
+        the arrivals of many paths does not pay the intensity sampling overhead
+        once per path.
+
+        :param time_horizon: time horizon
+        :param m: number of paths
+        """
+        paths = self.intensity.sample(
+            m, time_horizon, math.ceil(100 * time_horizon)
+        ).integrate()
+        # average arrival rate over the time horizon for each path
+        intensities = self.poisson.intensity * paths.data[-1, :] / time_horizon
+        return poisson_arrivals_batch(intensities, time_horizon, m)
 
     def sample_jumps(self, n: int) -> FloatArray:
         return self.poisson.sample_jumps(n)
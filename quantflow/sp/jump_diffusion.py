@@ -1,8 +1,8 @@
 from __future__ import annotations
 
+import math
 from typing import Generic
 
-import numpy as np
 from pydantic import Field
 
 from ..ta.paths import Paths
@@ -44,8 +44,10 @@ class JumpDiffusion(StochasticProcess1D, Generic[D]):
             path_j = args[0]
         else:
             path_j = self.jumps.sample(path_w.samples, path_w.t, path_w.time_steps)
-        path_w = self.diffusion.sample_from_draws(path_w)
-        return Paths(t=path_w.t, data=path_w.data + path_j.data)
+        paths = self.diffusion.sample_from_draws(path_w)
+        # the diffusion paths are a fresh array, add the jumps in place
+        paths.data += path_j.data
+        return paths
 
     def analytical_mean(self, t: FloatArrayLike) -> FloatArrayLike:
         return self.diffusion.analytical_mean(t) + self.jumps.analytical_mean(t)
@@ -88,6 +90,8 @@ class JumpDiffusion(StochasticProcess1D, Generic[D]):
                 jump_distribution_variance, jump_asymmetry
             )
             return cls(
-                diffusion=WeinerProcess(sigma=np.sqrt(variance * (1 - jump_fraction))),
+                diffusion=WeinerProcess(
+                    sigma=math.sqrt(variance * (1 - jump_fraction))
+                ),
                 jumps=CompoundPoissonProcess(intensity=jump_intensity, jumps=jumps),
             )
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+import math
 from typing import Generic
 
 import numpy as np
 from pydantic import Field
 from scipy.optimize import Bounds
-from scipy.stats import gamma, norm
+from scipy.signal import lfilter
+from scipy.special import gammaln, xlogy
+from scipy.stats import norm
 
 from ..ta.paths import Paths
 from ..utils.distributions import Exponential
-from ..utils.types import Float, FloatArrayLike, Vector
+from ..utils.types import FloatArrayLike, Vector
 from .base import Im, IntensityProcess
 from .poisson import CompoundPoissonProcess, D
 from .weiner import WeinerProcess
@@ -52,16 +55,26 @@ class Vasicek(IntensityProcess):
         return self.sample_from_draws(paths)
 
     def sample_from_draws(self, draws: Paths, *args: Paths) -> Paths:
+        r"""Sample paths with the exact discretization of the OU process
+
+        .. math::
+            x_{t+dt} = x_t e^{-\kappa dt} + \theta \left(1 - e^{-\kappa dt}\right)
+                + \sigma \sqrt{\frac{1 - e^{-2\kappa dt}}{2\kappa}} \epsilon_t
+
+        which has no discretization bias, whatever the time step.
+        """
         kappa = self.kappa
-        theta = self.theta
         dt = draws.dt
-        sdt = self.bdlp.sigma * np.sqrt(dt)
-        paths = np.zeros(draws.data.shape)
-        paths[0, :] = self.rate
+        phi = math.exp(-kappa * dt)
+        sdt = self.bdlp.sigma * math.sqrt(-math.expm1(-2 * kappa * dt) / (2 * kappa))
+        # with the noise and drift precomputed, each step is one in place
+        # multiply-add vectorized over the paths
+        paths = np.empty(draws.data.shape)
+        paths[0] = self.rate
+        np.multiply(draws.data[:-1], sdt, out=paths[1:])
+        paths[1:] -= self.theta * math.expm1(-kappa * dt)
         for t in range(draws.time_steps):
-            x = paths[t, :]
-            dx = kappa * (theta - x) * dt + sdt * draws.data[t, :]
-            paths[t + 1, :] = x + dx
+            paths[t + 1] += phi * paths[t]
         return Paths(t=draws.t, data=paths)
 
     def domain_range(self) -> Bounds:
@@ -113,9 +126,11 @@ class GammaOU(NGOU[Exponential]):
 
     def characteristic_exponent(self, t: FloatArrayLike, u: Vector) -> Vector:
         b = self.beta
+        kt = -self.kappa * t
         iu = Im * u
-        c1 = iu * np.exp(-self.kappa * t)
-        c0 = self.intensity * np.log((b - c1) / (b - iu))
+        c1 = iu * np.exp(kt)
+        # log((b - c1)/(b - iu)) via log1p, accurate for small frequencies
+        c0 = self.intensity * np.log1p(-iu * np.expm1(kt) / (b - iu))
         return -c0 - c1 * self.rate
 
     def integrated_log_laplace(self, t: FloatArrayLike, u: Vector) -> Vector:
@@ -123,60 +138,35 @@ class GammaOU(NGOU[Exponential]):
         b = self.beta
         iu = Im * u
         iuk = iu / kappa
-        ekt = np.exp(-kappa * t)
-        c1 = iuk * (1 - ekt)
-        c0 = self.intensity * (
-            b * np.log(b / (iuk + (b - iuk) / ekt)) / (iuk - b) - kappa * t
-        )
+        c1 = -iuk * np.expm1(-kappa * t)
+        # log(b/(iuk + (b - iuk) exp(kappa t))) = -kappa t - log(1 - c1/b), the
+        # kappa t terms cancel analytically leaving a log1p accurate for small
+        # kappa t and small frequencies
+        c0 = self.intensity * (b * np.log1p(-c1 / b) + iu * t) / (b - iuk)
         return np.exp(c0 + c1 * self.rate)
 
     def sample(self, n: int, time_horizon: float = 1, time_steps: int = 100) -> Paths:
         dt = time_horizon / time_steps
+        kappa = self.kappa
         jump_process = self.bdlp
-        paths = np.zeros((time_steps + 1, n))
-        paths[0, :] = self.rate
-        for p in range(n):
-            arrivals = jump_process.arrivals(self.kappa * time_horizon)
-            jumps = jump_process.sample_jumps(len(arrivals))
-            pp = paths[:, p]
-            i = 1
-            for arrival, jump in zip(arrivals, jumps):
-                arrival /= self.kappa
-                while i * dt < arrival:
-                    i = self._advance(i, pp, dt)
-                if i <= time_steps:
-                    i = self._advance(i, pp, dt, arrival, jump)
-            while i <= time_steps:
-                i = self._advance(i, pp, dt)
+        # arrivals in the BDLP clock (kappa*t) for all paths at once
+        arrivals, counts = jump_process.arrivals_batch(kappa * time_horizon, n)
+        arrivals /= kappa
+        jumps = jump_process.sample_jumps(len(arrivals))
+        # each jump lands in the step (t0, t1] which contains its arrival and is
+        # decayed exactly for the remaining fraction of that step
+        steps = np.clip(np.ceil(arrivals / dt).astype(int), 1, time_steps)
+        inc = np.zeros((time_steps + 1, n))
+        inc[0] = self.rate
+        np.add.at(
+            inc,
+            (steps, np.repeat(np.arange(n), counts)),
+            jumps * np.exp(-kappa * (steps * dt - arrivals)),
+        )
+        # exact recursion x_i = exp(-kappa*dt) x_{i-1} + inc_i along the time axis
+        paths = lfilter([1.0], [1.0, -math.exp(-kappa * dt)], inc, axis=0)
         return Paths(t=time_horizon, data=paths)
 
-    def _advance(
-        self,
-        i: int,
-        pp: np.ndarray,
-        dt: Float,
-        arrival: Float = 0,
-        jump: Float = 0,
-    ) -> int:
-        x = pp[i - 1]
-        kappa = self.kappa
-        t0 = i * dt
-        t1 = t0 + dt
-        a = arrival or t1
-        pp[i] = x - kappa * x * (a - t0) - kappa * (x + jump) * (t1 - a) + jump
-        return i + 1
-
-    def cumulative_characteristic2(self, t: FloatArrayLike, u: Vector) -> Vector:
-        """Formula from a paper"""
-        kappa = self.kappa
-        b = self.beta
-        iu = Im * u
-        iuk = iu / kappa
-        ekt = np.exp(-kappa * t)
-        c1 = iuk * (1 - ekt)
-        c0 = self.intensity * (b * np.log(b / (b - c1)) - iu * t) / (iuk - b)
-        return np.exp(c0 + c1 * self.rate)
-
     def analytical_mean(self, t: FloatArrayLike) -> FloatArrayLike:
         return self.intensity / self.beta
 
@@ -184,4 +174,9 @@ class GammaOU(NGOU[Exponential]):
         return self.intensity / self.beta / self.beta
 
     def analytical_pdf(self, t: FloatArrayLike, x: FloatArrayLike) -> FloatArrayLike:
-        return gamma.pdf(x, self.intensity, scale=1 / self.beta)
+        # gamma density with shape the intensity and rate beta
+        a = self.intensity
+        b = self.beta
+        y = np.maximum(x, 0)
+        log_pdf = xlogy(a - 1, y) - b * y + a * math.log(b) - gammaln(a)
+        return np.where(np.less(x, 0), 0.0, np.exp(log_pdf))
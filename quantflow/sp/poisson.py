@@ -7,13 +7,12 @@ import numpy as np
 from pydantic import Field
 from scipy.integrate import simpson
 from scipy.optimize import Bounds
-from scipy.stats import poisson
+from scipy.special import gammaincc, gammaln, xlogy
 
 from quantflow.ta.paths import Paths
 from quantflow.utils.distributions import Distribution1D
-from quantflow.utils.functions import factorial
 from quantflow.utils.transforms import TransformResult
-from quantflow.utils.types import FloatArray, FloatArrayLike, Vector
+from quantflow.utils.types import FloatArray, FloatArrayLike, IntArray, Vector
 
 from .base import Im, StochasticProcess1D, StochasticProcess1DMarginal
 
@@ -26,23 +25,36 @@ class PoissonBase(StochasticProcess1D):
         """Generate a list of jump sizes"""
 
     @abstractmethod
-    def arrivals(self, time_horizon: float = 1) -> list[float]:
-        """Generate a list of jump arrivals times up to time t"""
+    def arrivals(self, time_horizon: float = 1) -> FloatArray:
+        """Generate the sorted jump arrivals times up to time t"""
+
+    def arrivals_batch(
+        self, time_horizon: float = 1, m: int = 1
+    ) -> tuple[FloatArray, IntArray]:
+        """Generate jump arrivals times up to time t for `m` independent paths
+
+        The arrivals of all paths are returned as a single flat array, sorted
+        within each path, together with the number of arrivals of each path.
+        Subclasses can override this method with a vectorized implementation.
+        """
+        batch = [self.arrivals(time_horizon) for _ in range(m)]
+        counts = np.fromiter(map(len, batch), dtype=int, count=m)
+        return np.concatenate(batch) if batch else np.zeros(0), counts
 
     def sample(self, n: int, time_horizon: float = 1, time_steps: int = 100) -> Paths:
         dt = time_horizon / time_steps
-        paths = np.zeros((time_steps + 1, n))
-        for p in range(n):
-            if arrivals := self.arrivals(time_horizon):
-                jumps = self.sample_jumps(len(arrivals))
-                i = 1
-                y = 0.0
-                for j, arrival in enumerate(arrivals):
-                    while i * dt < arrival:
-                        paths[i, p] = y
-                        i += 1
-                    y += jumps[j]
-                paths[i:, p] = y
+        arrivals, counts = self.arrivals_batch(time_horizon, n)
+        jumps = self.sample_jumps(len(arrivals))
+        # each jump is added at the first time step on or after its arrival,
+        # bincount sums the jumps on the flattened (time_steps + 1, n) grid
+        steps = np.clip(np.ceil(arrivals / dt).astype(int), 1, time_steps)
+        index = steps * n + np.repeat(np.arange(n), counts)
+        paths = (
+            np.bincount(index, weights=jumps, minlength=(time_steps + 1) * n)
+            .reshape(time_steps + 1, n)
+            .astype(float, copy=False)
+        )
+        np.cumsum(paths, axis=0, out=paths)
         return Paths(t=time_horizon, data=paths)
 
     def sample_from_draws(self, draws: Paths, *args: Paths) -> Paths:
@@ -52,32 +64,75 @@ class PoissonBase(StochasticProcess1D):
         return Bounds(0, np.inf)
 
 
-def poisson_arrivals(intensity: float, time_horizon: float = 1) -> list[float]:
-    """Generate a list of jump arrivals times up to time t"""
-    exp_rate = 1.0 / intensity
-    arrivals = []
-    tt = 0.0
-    while tt < time_horizon:
-        dt = np.random.exponential(scale=exp_rate)
-        tt += dt
-        if tt <= time_horizon:
-            arrivals.append(tt)
+def poisson_arrivals(intensity: float, time_horizon: float = 1) -> FloatArray:
+    """Generate the sorted jump arrivals times up to time t
+
+    The number of arrivals is drawn from a Poisson distribution and, conditional
+    on it, the arrivals are sorted uniform draws in the time horizon.
+    """
+    count = np.random.poisson(intensity * time_horizon)
+    arrivals = np.random.uniform(0, time_horizon, size=count)
+    arrivals.sort()
     return arrivals
 
 
+def poisson_arrivals_batch(
+    intensity: FloatArrayLike, time_horizon: float = 1, m: int = 1
+) -> tuple[FloatArray, IntArray]:
+    """Generate jump arrivals times up to time t for `m` independent paths
+
+    The number of arrivals of each path is drawn from a Poisson distribution and,
+    conditional on it, the arrivals are sorted uniform draws in the time horizon.
+    The arrivals of all paths are returned as a single flat array together with
+    the number of arrivals of each path.
+
+    The sorted uniforms are generated without sorting: given :math:`k` arrivals,
+    they are distributed as the normalized partial sums
+    :math:`S_i / S_{k+1}` of :math:`k+1` standard exponential draws.
+
+    :param intensity: intensity rate, either a number or an array with the
+        intensity of each path
+    :param time_horizon: time horizon
+    :param m: number of paths
+    """
+    counts = np.random.poisson(intensity * time_horizon, size=m)
+    spacings = np.cumsum(np.random.exponential(size=counts.sum() + m))
+    # the last partial sum of each path normalizes its arrivals
+    ends = np.cumsum(counts + 1) - 1
+    offset = np.concatenate(([0.0], spacings[ends[:-1]]))
+    scale = time_horizon / (spacings[ends] - offset)
+    path = np.repeat(np.arange(m), counts)
+    arrivals = np.delete(spacings, ends)
+    return (arrivals - offset[path]) * scale[path], counts
+
+
+def poisson_logpmf(k: FloatArrayLike, rate: FloatArrayLike) -> FloatArray:
+    """Logarithm of the Poisson probability mass function at integer values ``k``
+
+    Computed in log-space, so it does not overflow for large ``k``
+    """
+    return xlogy(k, rate) - rate - gammaln(np.asarray(k) + 1)
+
+
 class PoissonProcess(PoissonBase):
     intensity: float = Field(default=1.0, ge=0, description="intensity rate")
     r"""Intensity rate :math:`\lambda` of the Poisson process"""
 
-    def marginal(self, t: FloatArrayLike) -> StochasticProcess1DMarginal:
+    def marginal(self, t: FloatArrayLike) -> MarginalDiscrete1D:
         return MarginalDiscrete1D(process=self, t=t)
 
     def characteristic_exponent(self, t: Vector, u: Vector) -> Vector:
-        return t * self.intensity * (1 - np.exp(Im * u))
+        # 1 - exp(iu) via expm1, accurate for small frequencies
+        return -t * self.intensity * np.expm1(Im * u)
 
-    def arrivals(self, time_horizon: float = 1) -> list[float]:
+    def arrivals(self, time_horizon: float = 1) -> FloatArray:
         return poisson_arrivals(self.intensity, time_horizon)
 
+    def arrivals_batch(
+        self, time_horizon: float = 1, m: int = 1
+    ) -> tuple[FloatArray, IntArray]:
+        return poisson_arrivals_batch(self.intensity, time_horizon, m)
+
     def sample_jumps(self, n: int) -> np.ndarray:
         """For a poisson process this is just a list of 1s"""
         return np.ones((n,))
@@ -112,7 +167,8 @@ class PoissonProcess(PoissonBase):
 
         where :math:`\Gamma` is the upper incomplete gamma function.
         """
-        return poisson.cdf(n, t * self.intensity)
+        k = np.floor(n)
+        return np.where(k >= 0, gammaincc(np.maximum(k, 0) + 1, t * self.intensity), 0)
 
     def analytical_pdf(self, t: FloatArrayLike, n: FloatArrayLike) -> FloatArrayLike:
         r"""
@@ -125,7 +181,9 @@ class PoissonProcess(PoissonBase):
 
             f\left(n\right)=\frac{\lambda^{n}e^{-\lambda}}{n!}
         """
-        return poisson.pmf(n, t * self.intensity)
+        k = np.asarray(n)
+        pdf = np.exp(poisson_logpmf(k, t * self.intensity))
+        return np.where((k >= 0) & (k == np.floor(k)), pdf, 0)
 
     def cdf_jacobian(self, t: FloatArrayLike, n: Vector) -> np.ndarray:
         r"""
@@ -139,9 +197,8 @@ class PoissonProcess(PoissonBase):
             \frac{\partial F}{\partial\lambda}=-\frac{\lambda^{\left\lfloor
             n\right\rfloor }e^{-\lambda}}{\left\lfloor n\right\rfloor !}
         """
-        k = np.floor(n).astype(int)
-        rate = self.intensity
-        return np.array([-(rate**k) * np.exp(-rate)]) / factorial(k)
+        k = np.floor(n)
+        return np.array([-np.exp(poisson_logpmf(k, self.intensity))])
 
 
 class CompoundPoissonProcess(PoissonBase, Generic[D]):
@@ -167,10 +224,16 @@ class CompoundPoissonProcess(PoissonBase, Generic[D]):
         """
         return t * self.intensity * (1 - self.jumps.characteristic(u))
 
-    def arrivals(self, time_horizon: float = 1) -> list[float]:
+    def arrivals(self, time_horizon: float = 1) -> FloatArray:
         """Same as Poisson process"""
         return poisson_arrivals(self.intensity, time_horizon)
 
+    def arrivals_batch(
+        self, time_horizon: float = 1, m: int = 1
+    ) -> tuple[FloatArray, IntArray]:
+        """Same as Poisson process"""
+        return poisson_arrivals_batch(self.intensity, time_horizon, m)
+
     def sample_jumps(self, n: int) -> FloatArray:
         """Sample jump sizes from an exponential distribution with rate
         parameter :class:b
@@ -221,33 +284,103 @@ class MarginalDiscrete1D(StochasticProcess1DMarginal):
         cdf = self.cdf_from_characteristic(n, **kwargs)
         return cdf._replace(y=np.diff(cdf.y, prepend=0))
 
+    def lattice_size(self, n: int = 0) -> int:
+        """Number of integers, starting from 0, which carry the probability mass
+
+        It covers ten standard deviations above the mean, and at least `n`
+        integers.
+        """
+        upper = np.max(self.mean() + 10 * self.std())
+        return max(64, n, int(np.ceil(upper)) + 1)
+
+    def pdf_at(self, n: Vector, *, frequency_n: int | None = None) -> FloatArray:
+        r"""Probability mass at the integers `n` from the characteristic function
+
+        The inverse discrete Fourier transform is evaluated only at the
+        requested points, which is cheaper than :meth:`pdf_from_characteristic`
+        when few values are needed.
+
+        :param n: Integer values at which to evaluate the probability mass
+        :param frequency_n: Number of frequencies in :math:`[0, 2\pi)`, it must
+            exceed the largest integer with non-negligible mass. If not provided
+            it is twice the :meth:`lattice_size`.
+
+        When the marginal time horizon `t` is an array, the result has shape
+        ``t.shape + n.shape``.
+        """
+        k = np.floor(n).astype(int)
+        size = frequency_n or 2 * self.lattice_size(int(np.max(k)) + 1)
+        u = 2 * np.pi * np.arange(size) / size
+        psi = self._characteristic_grid(u)
+        dft = np.exp(-Im * np.multiply.outer(k.ravel(), u))
+        pdf = (psi @ dft.T).real / size
+        return pdf.reshape(psi.shape[:-1] + k.shape)
+
     def cdf_from_characteristic(
         self,
         n: int | None = None,
         *,
         frequency_n: int | None = None,
         simpson_rule: bool = True,
+        use_fft: bool = False,
         **kwargs: Any,
     ) -> TransformResult:
+        r"""Cumulative distribution at the integers :math:`0, \dots, n-1`
+        from the characteristic function
+
+        :param n: Number of integers, if not provided it is 10
+        :param frequency_n: Number of frequencies in :math:`[0, \pi]`
+        :param simpson_rule: Use Simpson's rule rather than the trapezoidal
+            rule for the quadrature, ignored when `use_fft` is True
+        :param use_fft: Invert the characteristic function with a discrete
+            Fourier transform of the frequencies :math:`2\pi j/N`, which is exact
+            on the integer lattice up to the aliasing of the mass above :math:`N`,
+            with :math:`N` at least twice `frequency_n`. The quadrature options
+            are ignored. If False, the default, the cumulative distribution is
+            integrated with a quadrature on the frequency grid of
+            :meth:`get_transform`.
+
+        When the marginal time horizon `t` is an array, the discrete Fourier
+        transform is always used, it evaluates all the horizons at once and `y`
+        has shape ``t.shape + (n,)``.
+        """
         n = n or 10
+        x = np.arange(n, dtype=float)
+        if use_fft or np.ndim(self.t):
+            size = 2 * max(frequency_n or 0, self.lattice_size(n))
+            # the characteristic function at negative frequencies is the
+            # conjugate, so half of the grid is enough for a real inverse FFT
+            psi = self._characteristic_grid(2 * np.pi * np.arange(size // 2 + 1) / size)
+            pdf = np.maximum(np.fft.irfft(psi.conj(), size)[..., :n], 0)
+            return TransformResult(x=x, y=np.cumsum(pdf, axis=-1))
         transform = self.get_transform(frequency_n, self.support, **kwargs)
         frequency = transform.frequency_domain
         c = self.characteristic(frequency)
         a = 1 / np.pi
-        result = []
-        x = np.arange(n or 10)
-        for m in x:
-            d = np.sin(0.5 * frequency)
-            d[0] = 1.0
-            f = (
-                np.sin(0.5 * (m + 1) * frequency)
-                * (c * np.exp(-0.5 * Im * m * frequency)).real
-                / d
-            )
-            f[0] = c[0].real  # type: ignore[index]
-            if simpson_rule:
-                result.append(a * simpson(f, x=frequency))
-            else:
-                result.append(a * np.trapezoid(f, frequency))
+        # integrands for all the values of x on a (n, frequencies) grid
+        half = 0.5 * frequency
+        d = np.sin(half)
+        d[0] = 1.0
+        # powers w^m of w = exp(i*frequency/2) give both sin((m+1)*frequency/2)
+        # and exp(-i*m*frequency/2) with a product per entry rather than a
+        # transcendental function
+        w = np.empty((n + 1, len(frequency)), dtype=complex)
+        w[0] = 1.0
+        w[1:] = np.exp(Im * half)
+        np.cumprod(w, axis=0, out=w)
+        f = w[1:].imag * (c * w[:-1].conj()).real / d
+        f[:, 0] = c[0].real  # type: ignore[index]
+        if simpson_rule:
+            result = a * simpson(f, x=frequency, axis=-1)
+        else:
+            result = a * np.trapezoid(f, frequency, axis=-1)
         pdf = np.maximum(np.diff(result, prepend=0), 0)
-        return TransformResult(x=x, y=np.cumsum(pdf))  # type: ignore[arg-type]
+        return TransformResult(x=x, y=np.cumsum(pdf))
+
+    def _characteristic_grid(self, u: FloatArray) -> np.ndarray:
+        """Characteristic function on the frequencies `u` for each time horizon,
+        with shape ``t.shape + u.shape``"""
+        t = np.asarray(self.t)
+        if t.ndim:
+            return np.asarray(self.process.characteristic(t[..., None], u))
+        return np.asarray(self.characteristic(u))
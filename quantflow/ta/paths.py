@@ -8,6 +8,8 @@ import pandas as pd
 from numpy.random import normal
 from pydantic import BaseModel, Field
 from scipy.integrate import cumulative_trapezoid
+from scipy.special import ndtri
+from scipy.stats import qmc
 
 from quantflow.utils import plot
 from quantflow.utils.bins import pdf as bins_pdf
@@ -203,3 +205,32 @@ class Paths(BaseModel, arbitrary_types_allowed=True):
                 extra_data = normal(size=(time_steps + 1, odd))
                 data = np.concatenate((data, extra_data), axis=1)
         return cls(t=time_horizon, data=data)
+
+    @classmethod
+    def sobol_draws(
+        cls,
+        paths: int,
+        time_horizon: float = 1,
+        time_steps: int = 1000,
+        seed: int | None = None,
+    ) -> Paths:
+        """Generate normal draws from a scrambled `Sobol sequence`_
+
+        Quasi-random draws fill the space of paths more evenly than
+        pseudo-random ones and therefore reduce the Monte Carlo error of
+        expectations at a given number of paths. Each time step is a dimension
+        of the sequence and each path a point. The balance properties of the
+        sequence require `paths` to be a power of 2.
+
+        The draws can be passed to the `sample_from_draws` method of a process.
+
+        :param paths: number of paths
+        :param time_horizon: time horizon
+        :param time_steps: number of time steps to arrive at horizon
+        :param seed: optional seed for the scrambling
+
+        .. _Sobol sequence: https://en.wikipedia.org/wiki/Sobol_sequence
+        """
+        sampler = qmc.Sobol(d=time_steps + 1, scramble=True, seed=seed)
+        data = ndtri(sampler.random(paths).transpose())
+        return cls(t=time_horizon, data=np.ascontiguousarray(data))
@@ -92,7 +92,17 @@ class Exponential(Distribution1D):
             F(x) = 1 - e^{-\lambda x}\ \ \forall x \geq 0
 
         """
-        return 1.0 - np.exp(-self.decay * x)
+        return -np.expm1(-self.decay * x)
+
+    def ppf(self, p: FloatArrayLike) -> FloatArrayLike:
+        r"""The inverse of the :meth:`cdf`, also known as the quantile function
+
+        .. math::
+            F^{-1}(p) = -\frac{\log\left(1 - p\right)}{\lambda}
+
+        It maps uniform draws into exponential samples.
+        """
+        return -np.log1p(-p) * self.scale
 
 
 class Normal(Distribution1D):
@@ -115,7 +125,7 @@ class Normal(Distribution1D):
     @classmethod
     def from_variance_and_asymmetry(cls, variance: float, asymmetry: float) -> Self:
         """The normal distribution is symmetric, so the asymmetry is ignored"""
-        return cls(mu=0, sigma=np.sqrt(variance))
+        return cls(mu=0, sigma=float(np.sqrt(variance)))
 
     @property
     def sigma2(self) -> float:
@@ -142,7 +152,7 @@ class Normal(Distribution1D):
 
     def set_variance(self, variance: float) -> None:
         """Set the variance of the distribution"""
-        self.sigma = np.sqrt(variance)
+        self.sigma = float(np.sqrt(variance))
 
 
 class DoubleExponential(Exponential):
@@ -182,7 +192,7 @@ class DoubleExponential(Exponential):
 
     @classmethod
     def from_variance_and_asymmetry(cls, variance: float, asymmetry: float) -> Self:
-        return cls.from_moments(variance=variance, kappa=np.exp(asymmetry))
+        return cls.from_moments(variance=variance, kappa=float(np.exp(asymmetry)))
 
     @classmethod
     def from_moments(
@@ -200,7 +210,7 @@ class DoubleExponential(Exponential):
         :param kappa: The asymmetry parameter of the distribution, 1 for symmetric
         """
         k2 = kappa * kappa
-        decay = np.sqrt((1 + k2 * k2) / (variance * k2))
+        decay = float(np.sqrt((1 + k2 * k2) / (variance * k2)))
         return cls(decay=decay, kappa=kappa, loc=mean - (1 - k2) / (kappa * decay))
 
     def characteristic(self, u: Vector) -> Vector:
@@ -228,6 +238,12 @@ class DoubleExponential(Exponential):
             x, self.kappa, loc=self.loc, scale=self.scale
         )
 
+    def ppf(self, p: FloatArrayLike) -> FloatArrayLike:
+        """The inverse of the cdf, also known as the quantile function"""
+        return stats.laplace_asymmetric.ppf(
+            p, self.kappa, loc=self.loc, scale=self.scale
+        )
+
     def sample(self, n: int) -> np.ndarray:
         """Sample from the double exponential distribution"""
         return stats.laplace_asymmetric.rvs(
@@ -248,7 +264,7 @@ class DoubleExponential(Exponential):
     def set_variance(self, variance: float) -> None:
         """Set the variance of the distribution"""
         k2 = self.kappa * self.kappa
-        self.decay = np.sqrt((1 + k2 * k2) / (variance * k2))
+        self.decay = float(np.sqrt((1 + k2 * k2) / (variance * k2)))
 
     def set_asymmetry(self, asymmetry: float) -> None:
-        self.kappa = np.exp(asymmetry)
+        self.kappa = float(np.exp(asymmetry))
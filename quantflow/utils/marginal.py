@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 from typing import Callable, cast
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 from pydantic import BaseModel
 from scipy.optimize import Bounds
@@ -107,6 +108,7 @@ class Marginal1D(BaseModel, ABC, extra="forbid"):
         simpson_rule: bool = False,
         use_fft: bool = False,
         frequency_n: int | None = None,
+        dtype: npt.DTypeLike = np.float64,
     ) -> TransformResult:
         """
         Compute the probability density function from the characteristic function.
@@ -118,6 +120,9 @@ class Marginal1D(BaseModel, ABC, extra="forbid"):
             Only needed for special cases/testing.
         :param simpson_rule: Use Simpson's rule for integration. Default is False.
         :param use_fft: Use FFT for the transform. Default is False.
+        :param dtype: Floating point type of the frequency grid, `np.float32`
+            evaluates the characteristic function and the transform in single
+            precision. Default is `np.float64`.
         """
         transform = self.get_transform(
             frequency_n or n,
@@ -125,6 +130,7 @@ class Marginal1D(BaseModel, ABC, extra="forbid"):
             max_frequency=max_frequency,
             simpson_rule=simpson_rule,
             use_fft=use_fft,
+            dtype=dtype,
         )
         psi = cast(np.ndarray, self.characteristic(transform.frequency_domain))
         return transform(psi, use_fft=use_fft)
@@ -149,13 +155,20 @@ class Marginal1D(BaseModel, ABC, extra="forbid"):
         alpha: float | None = None,
         simpson_rule: bool = False,
         use_fft: bool = False,
+        dtype: npt.DTypeLike = np.float64,
     ) -> TransformResult:
+        """Call option prices from the characteristic function
+
+        :param dtype: Floating point type of the frequency grid, `np.float32`
+            prices in single precision which is usually enough for calibration
+        """
         transform = self.get_transform(
             n,
             lambda m: self.option_support(m + 1, max_moneyness=max_moneyness),
             max_frequency=max_frequency,
             simpson_rule=simpson_rule,
             use_fft=use_fft,
+            dtype=dtype,
         )
         alpha = alpha or self.option_alpha()
         phi = cast(
@@ -219,6 +232,7 @@ class Marginal1D(BaseModel, ABC, extra="forbid"):
         max_frequency: float | None = None,
         simpson_rule: bool = False,
         use_fft: bool = False,
+        dtype: npt.DTypeLike = np.float64,
     ) -> Transform:
         n = n or 128
         if use_fft:
@@ -231,6 +245,7 @@ class Marginal1D(BaseModel, ABC, extra="forbid"):
             frequency_range=self.frequency_range(max_frequency),
             domain_range=bounds,
             simpson_rule=simpson_rule,
+            dtype=dtype,
         )
 
     def pdf_jacobian(self, x: FloatArrayLike) -> FloatArrayLike:
@@ -267,7 +282,10 @@ class Marginal1D(BaseModel, ABC, extra="forbid"):
         return self.characteristic_corrected(u - 1j) / (uj * uj + uj)
 
     def characteristic_corrected(self, u: Vector) -> Vector:
-        convexity = np.log(self.characteristic(-1j))
+        # match the precision of u, so that single precision is preserved
+        convexity = np.asarray(
+            np.log(self.characteristic(-1j)), dtype=np.result_type(u, 1j)
+        )
         return self.characteristic(u) * np.exp(-1j * u * convexity)
 
     def option_time_value_transform(self, u: Vector, alpha: float = 1.1) -> Vector:
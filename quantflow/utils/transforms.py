@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, NamedTuple
 
 import numpy as np
 import numpy.typing as npt
 import pandas as pd
+from scipy.fft import next_fast_len
 from scipy.optimize import Bounds
 
 from .types import FloatArray
@@ -92,11 +94,20 @@ class Transform:
         frequency_range: Bounds | None = None,
         domain_range: Bounds | None = None,
         simpson_rule: bool = False,
+        dtype: npt.DTypeLike = np.float64,
     ) -> Transform:
+        """Create a transform with `n` discretization points
+
+        :param dtype: floating point type of the frequency grid, use
+            `np.float32` to evaluate characteristic functions and FFTs
+            in single precision
+        """
+        frequency_domain = grid_from_bounds(frequency_range or Bounds(0, 20), n)
+        h = simpson(n) if simpson_rule else trapezoid(n)
         return cls(
-            frequency_domain=grid_from_bounds(frequency_range or Bounds(0, 20), n),
+            frequency_domain=frequency_domain.astype(dtype, copy=False),
             domain_range=domain_range or default_bounds(),
-            h=simpson(n) if simpson_rule else trapezoid(n),
+            h=h.astype(dtype, copy=False),
         )
 
     @property
@@ -145,7 +156,8 @@ class Transform:
         if y.shape != self.frequency_domain.shape:
             raise TransformError("shapes not compatible")
         x = self.space_domain(delta_x)
-        b = -x[0]
+        # python float so that it does not promote single precision grids
+        b = -float(x[0])
         t = (
             self.h
             * self.n
@@ -197,15 +209,12 @@ class FrFT:
     @classmethod
     def calculate(cls, x: np.ndarray, zeta: float) -> FrFT:
         n = x.shape[0]
-        g = grid(n)
-        ez = coef(g, zeta)
-        # ez2 = np.flip(ez)
-        ez2 = coef(n - g, zeta)
+        ez, z, fft_z = chirp(n, float(zeta), x.dtype)
         ezi = 1 / ez
-        y = np.concatenate((x * ezi, np.zeros(n)))
-        z = np.concatenate((ez, ez2))
+        # zero-pad to the length of the convolution kernel
+        y = np.zeros(z.shape, dtype=ezi.dtype)
+        y[:n] = x * ezi
         fft_y = np.fft.fft(y)
-        fft_z = np.fft.fft(z)
         y_z = np.fft.ifft(fft_y * fft_z) / n
         result = ezi * y_z[:n]
         return cls(
@@ -222,3 +231,30 @@ class FrFT:
 
 def coef(g: np.ndarray, zeta: float) -> np.ndarray:
     return np.exp(0.5 * 1j * g * g * zeta)
+
+
+@lru_cache(maxsize=32)
+def chirp(
+    n: int, zeta: float, dtype: npt.DTypeLike = np.complex128
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Chirp coefficients of the Fractional Fourier Transform
+
+    They depend only on the size, the zeta parameter and the precision, so
+    they are cached together with the FFT of the convolution kernel.
+    The returned arrays are read-only.
+
+    The circular convolution needs at least `2n` points, the kernel is padded
+    to the next length with small prime factors so that any `n` has a fast
+    FFT.
+    """
+    g = grid(n)
+    m = next_fast_len(2 * n)
+    cdtype = np.result_type(dtype, np.complex64)
+    ez = coef(g, zeta).astype(cdtype, copy=False)
+    z = np.zeros(m, dtype=cdtype)
+    z[:n] = ez
+    z[m - n :] = coef(n - g, zeta)
+    fft_z = np.fft.fft(z)
+    for a in (ez, z, fft_z):
+        a.setflags(write=False)
+    return ez, z, fft_z
@@ -2,6 +2,7 @@ import numpy as np
 import pytest
 
 from quantflow.sp.cir import CIR, SamplingAlgorithm
+from quantflow.ta.paths import Paths
 
 
 @pytest.fixture
@@ -36,3 +37,32 @@ def test_cir_pdf(cir: CIR):
     m = cir.marginal(1)
     pdf = m.pdf_from_characteristic(128, max_frequency=20)
     np.testing.assert_array_almost_equal(pdf.y, m.pdf(pdf.x), 1e-1)
+
+
+def test_cir_exact_sampling() -> None:
+    cir = CIR(kappa=1, sigma=2, sample_algo=SamplingAlgorithm.exact)
+    m = cir.marginal(1)
+    draws = Paths.normal_draws(2000, time_horizon=1, time_steps=10)
+    for paths in (
+        cir.sample(2000, time_horizon=1, time_steps=10),
+        cir.sample_exact(draws),
+    ):
+        assert np.all(paths.data >= 0)
+        assert paths.mean()[-1] == pytest.approx(m.mean(), rel=0.1)
+        assert paths.std()[-1] == pytest.approx(m.std(), rel=0.1)
+
+
+def test_cir_exact_sampling_tails() -> None:
+    cir = CIR(kappa=1, sigma=2, sample_algo=SamplingAlgorithm.exact)
+    draws = Paths.normal_draws(3, time_horizon=1, time_steps=4)
+    draws.data[1] = [9.0, -9.0, 20.0]
+    paths = cir.sample_exact(draws)
+    assert np.all(np.isfinite(paths.data))
+    assert paths.data[2, 0] > paths.data[2, 1]
+
+
+def test_cir_moments(cir: CIR) -> None:
+    t = np.linspace(0.1, 2, 20)
+    mean, std = cir.analytical_moments(t)
+    np.testing.assert_allclose(mean, cir.analytical_mean(t))
+    np.testing.assert_allclose(std, cir.analytical_std(t))
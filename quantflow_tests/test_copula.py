@@ -2,8 +2,10 @@ from decimal import Decimal
 from math import isclose
 
 import numpy as np
+import pytest
+from scipy.integrate import dblquad
 
-from quantflow.sp.copula import FrankCopula, IndependentCopula
+from quantflow.sp.copula import FrankCopula, IndependentCopula, _frank_rho, _frank_tau
 
 
 def test_independent_copula():
@@ -17,14 +19,72 @@ def test_frank_copula():
     c = FrankCopula(kappa=Decimal("0.3"))
     assert c.kappa == Decimal("0.3")
     assert c.tau() > 0
-    assert c.rho() < 0
+    assert c.rho() > 0
     assert c.jacobian(0.3, 0.4).shape == (3,)
 
     c.kappa = 0
     assert c.tau() == 0
     assert c.rho() == 0
-    assert np.allclose(c.jacobian(0.3, 0.4), np.array([0.4, 0.3, 0.0]))
+    assert np.allclose(c.jacobian(0.3, 0.4), np.array([0.4, 0.3, 0.0252]))
 
     c = FrankCopula()
     assert isclose(c(11.0, 3.0), 33.0)
     assert isclose(c(11.0, 3.0), 33.0)
+
+
+def test_frank_copula_jacobian():
+    c = FrankCopula(kappa=Decimal("2.5"))
+    u, v, h = 0.3, 0.6, 1e-6
+    du = (c(u + h, v) - c(u - h, v)) / (2 * h)
+    dv = (c(u, v + h) - c(u, v - h)) / (2 * h)
+    cp = FrankCopula(kappa=Decimal(2.5 + h))
+    cm = FrankCopula(kappa=Decimal(2.5 - h))
+    dk = (cp(u, v) - cm(u, v)) / (2 * h)
+    np.testing.assert_allclose(c.jacobian(u, v), [du, dv, dk], rtol=1e-6)
+
+
+def test_frank_copula_small_kappa():
+    c = FrankCopula(kappa=Decimal("1e-7"))
+    assert c.tau() == pytest.approx(1e-7 / 9)
+    assert c.rho() == pytest.approx(1e-7 / 6)
+    # the expansion joins the closed form continuously
+    below = FrankCopula(kappa=Decimal("0.000999999"))
+    above = FrankCopula(kappa=Decimal("0.001"))
+    assert below(0.3, 0.6) == pytest.approx(above(0.3, 0.6), abs=1e-10)
+    np.testing.assert_allclose(
+        below.jacobian(0.3, 0.6), above.jacobian(0.3, 0.6), rtol=1e-8
+    )
+
+
+@pytest.mark.parametrize("kappa", ["-1e-5", "1e-4", "0.0009"])
+def test_frank_copula_small_kappa_jacobian(kappa: str) -> None:
+    # the jacobian differentiates the same expansion used by the copula
+    c = FrankCopula(kappa=Decimal(kappa))
+    k, u, v, h = float(kappa), 0.3, 0.6, 1e-5
+    du = (c(u + h, v) - c(u - h, v)) / (2 * h)
+    dv = (c(u, v + h) - c(u, v - h)) / (2 * h)
+    hk = 1e-6
+    cp = FrankCopula(kappa=Decimal(k + hk))
+    cm = FrankCopula(kappa=Decimal(k - hk))
+    dk = (cp(u, v) - cm(u, v)) / (2 * hk)
+    expected = np.array([du, dv, dk], dtype=float)
+    np.testing.assert_allclose(np.asarray(c.jacobian(u, v)), expected, rtol=1e-7)
+
+
+@pytest.mark.parametrize("kappa", [-5, 0.3, 5])
+def test_frank_copula_rho(kappa: float) -> None:
+    c = FrankCopula(kappa=Decimal(kappa))
+    # Spearman's rho is 12 times the integral of the copula minus 3
+    integral = dblquad(lambda v, u: float(c(u, v)), 0, 1, 0, 1, epsabs=1e-12)[0]
+    assert c.rho() == pytest.approx(12 * integral - 3, abs=1e-9)
+    assert np.sign(c.rho()) == np.sign(c.tau()) == np.sign(kappa)
+
+
+def test_frank_copula_cache() -> None:
+    c = FrankCopula(kappa=Decimal("3.5"))
+    assert c.rho() == _frank_rho.__wrapped__(3.5)
+    assert c.tau() == _frank_tau.__wrapped__(3.5)
+    # a cached value is returned on the second call
+    hits = _frank_rho.cache_info().hits
+    assert c.rho() == _frank_rho.__wrapped__(3.5)
+    assert _frank_rho.cache_info().hits == hits + 1
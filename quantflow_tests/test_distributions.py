@@ -1,7 +1,8 @@
 import numpy as np
 import pytest
+from scipy import stats
 
-from quantflow.utils.distributions import DoubleExponential
+from quantflow.utils.distributions import DoubleExponential, Exponential
 
 
 def test_double_exponential():
@@ -29,3 +30,23 @@ def test_double_exponential_samples():
     d = DoubleExponential.from_moments(mean=-1, variance=2, kappa=2)
     assert d.mean() == -1
     assert d.variance() == pytest.approx(2)
+
+
+def test_exponential_ppf():
+    d = Exponential(decay=2)
+    p = np.linspace(0, 0.99, 12)
+    np.testing.assert_allclose(d.cdf(d.ppf(p)), p)
+    d = DoubleExponential(decay=0.1, kappa=2)
+    cdf = stats.laplace_asymmetric.cdf(d.ppf(p), d.kappa, loc=d.loc, scale=d.scale)
+    np.testing.assert_allclose(cdf, p, atol=1e-12)
+
+
+def test_setters_out_of_domain():
+    # out of domain inputs give nan/inf rather than raising
+    d = DoubleExponential()
+    with np.errstate(all="ignore"):
+        d.set_asymmetry(1000)
+        assert d.kappa == np.inf
+        d.set_variance(-1)
+    assert np.isnan(d.decay)
+    assert isinstance(d.decay, float)
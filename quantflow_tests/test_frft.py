@@ -27,3 +27,20 @@ def test_transform_positive_domain():
     x = t.space_domain(1)
     assert len(x) == n
     np.testing.assert_almost_equal(x, np.linspace(0, n - 1, n))
+
+
+def test_frft_chirp_cached(x):
+    t1 = FrFT.calculate(x, 0.01)
+    t2 = FrFT.calculate(2 * x, 0.01)
+    assert t1.fft_z is t2.fft_z
+    assert not t1.fft_z.flags.writeable
+    np.testing.assert_allclose(t2.result, 2 * t1.result)
+
+
+@pytest.mark.parametrize("n", [97, 128, 211])
+def test_frft_direct_sum(n):
+    x = np.random.normal(size=n) + 0j
+    zeta = 0.013
+    g = np.arange(n)
+    expected = np.exp(-1j * zeta * np.outer(g, g)) @ x / n
+    np.testing.assert_allclose(FrFT.calculate(x, zeta).result, expected, atol=1e-12)
@@ -1,3 +1,6 @@
+from typing import cast
+
+import numpy as np
 import pytest
 
 from quantflow.sp.heston import Heston, HestonJ
@@ -37,3 +40,47 @@ def test_heston_jumps_characteristic(heston_jumps: HestonJ) -> None:
     characteristic_tests(m)
     assert m.mean() == 0.0
     assert m.std() == pytest.approx(0.5)
+
+
+def test_characteristic_grid(heston: Heston) -> None:
+    t = np.array([0.1, 0.5, 1.0, 2.0])
+    u = np.linspace(-10, 10, 41)
+    grid = cast(np.ndarray, heston.characteristic_exponent(t[:, None], u))
+    assert grid.shape == (4, 41)
+    for i, ti in enumerate(t):
+        np.testing.assert_allclose(grid[i], heston.characteristic_exponent(ti, u))
+
+
+def test_call_option_single_precision(heston: Heston) -> None:
+    m = heston.marginal(0.5)
+    u = np.linspace(0, 10, 5, dtype=np.float32)
+    assert cast(np.ndarray, m.characteristic(u)).dtype == np.complex64
+    c64 = m.call_option(128)
+    c32 = m.call_option(128, dtype=np.float32)
+    np.testing.assert_allclose(c32.x, c64.x)
+    np.testing.assert_allclose(c32.y, c64.y, atol=1e-5)
+
+
+def test_characteristic_exponent_jacobian() -> None:
+    heston = Heston.create(vol=0.5, kappa=2, sigma=0.8, rho=-0.4)
+    vp = heston.variance_process
+    u = np.linspace(-20, 20, 81) - 0.5j
+    t = np.array([[0.1], [1.0]])
+    jacobian = heston.characteristic_exponent_jacobian(t, u)
+    assert jacobian.shape == (5, 2, 81)
+    h = 1e-6
+    params = (
+        (vp, "rate"),
+        (vp, "theta"),
+        (vp, "kappa"),
+        (vp, "sigma"),
+        (heston, "rho"),
+    )
+    for i, (model, name) in enumerate(params):
+        value = getattr(model, name)
+        setattr(model, name, value + h)
+        up = cast(np.ndarray, heston.characteristic_exponent(t, u))
+        setattr(model, name, value - h)
+        down = cast(np.ndarray, heston.characteristic_exponent(t, u))
+        setattr(model, name, value)
+        np.testing.assert_allclose(jacobian[i], (up - down) / (2 * h), atol=1e-6)
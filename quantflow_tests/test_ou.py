@@ -1,4 +1,7 @@
+import numpy as np
 import pytest
+from scipy.integrate import quad_vec
+from scipy.stats import gamma
 
 from quantflow.sp.bns import BNS
 from quantflow.sp.ou import GammaOU, Vasicek
@@ -31,6 +34,57 @@ def test_sample(gamma_ou: GammaOU) -> None:
     assert paths.dt == 0.01
 
 
+def test_sample_mean(gamma_ou: GammaOU) -> None:
+    # the scheme is exact, so even a coarse grid has no bias. The standard error
+    # of the mean is sqrt(0.1/2000) = 0.007, the tolerance is 7 standard errors
+    for time_steps in (2, 100):
+        paths = gamma_ou.sample(2000, 1, time_steps)
+        assert paths.data[0].mean() == 1
+        assert paths.data[-1].mean() == pytest.approx(gamma_ou.analytical_mean(1), 0.05)
+
+
+def test_integrated_log_laplace(gamma_ou: GammaOU) -> None:
+    u = np.array([1e-3, 1.0, 10.0])
+    # for a small horizon the integral is close to rate * t
+    t = 1e-9
+    np.testing.assert_allclose(
+        np.log(gamma_ou.integrated_log_laplace(t, u)), 1j * u * t, rtol=1e-8
+    )
+    # the integral of the process is the integral of the initial value decay
+    # plus the integrated decay of each jump, with arrival rate intensity*kappa
+    t = 2.0
+    kappa = gamma_ou.kappa
+
+    def jumps(s: float) -> np.ndarray:
+        v = -u * np.expm1(-kappa * (t - s)) / kappa
+        return np.asarray(gamma_ou.bdlp.jumps.characteristic(v)) - 1
+
+    exponent = 1j * u * gamma_ou.rate * -np.expm1(-kappa * t) / kappa
+    exponent += gamma_ou.intensity * kappa * quad_vec(jumps, 0, t, epsabs=1e-14)[0]
+    np.testing.assert_allclose(
+        gamma_ou.integrated_log_laplace(t, u), np.exp(exponent), rtol=1e-12
+    )
+
+
+def test_analytical_pdf(gamma_ou: GammaOU) -> None:
+    x = np.array([-1.0, 0.0, 0.05, 0.1, 0.5, 2.0])
+    np.testing.assert_allclose(
+        gamma_ou.analytical_pdf(1, x),
+        gamma.pdf(x, gamma_ou.intensity, scale=1 / gamma_ou.beta),
+        rtol=1e-12,
+    )
+
+
+def test_single_precision(gamma_ou: GammaOU, vasicek: Vasicek) -> None:
+    u = np.linspace(0, 10, 11, dtype=np.float32)
+    for process in (gamma_ou, vasicek):
+        c = process.characteristic(1.0, u)
+        assert np.asarray(c).dtype == np.complex64
+        np.testing.assert_allclose(
+            c, process.characteristic(1.0, u.astype(float)), atol=1e-6
+        )
+
+
 def test_vasicek(vasicek: Vasicek) -> None:
     m = vasicek.marginal(10)
     characteristic_tests(m)
@@ -41,6 +95,13 @@ def test_vasicek(vasicek: Vasicek) -> None:
     assert m.std_from_characteristic() == pytest.approx(m.std(), 1e-3)
 
 
+def test_vasicek_sample(vasicek: Vasicek) -> None:
+    # the exact discretization has no bias even with a coarse time step
+    paths = vasicek.sample(20000, 1, 5)
+    assert paths.data[-1].mean() == pytest.approx(vasicek.analytical_mean(1), abs=0.01)
+    assert paths.data[-1].std() == pytest.approx(vasicek.analytical_std(1), 0.02)
+
+
 def test_bns(bns: BNS):
     m = bns.marginal(1)
     assert bns.characteristic(1, 0) == 1
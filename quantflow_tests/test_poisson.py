@@ -2,9 +2,15 @@ import math
 
 import numpy as np
 import pytest
+from scipy.stats import poisson as poisson_dist
 
 from quantflow.sp.dsp import DSP
-from quantflow.sp.poisson import CompoundPoissonProcess, PoissonProcess
+from quantflow.sp.poisson import (
+    CompoundPoissonProcess,
+    PoissonProcess,
+    poisson_arrivals,
+    poisson_arrivals_batch,
+)
 from quantflow.utils.distributions import DoubleExponential, Exponential, Normal
 from quantflow_tests.utils import analytical_tests, characteristic_tests
 
@@ -34,6 +40,11 @@ def test_characteristic(poisson: PoissonProcess) -> None:
     assert pytest.approx(m1.std()) == math.sqrt(2)
     assert pytest.approx(m1.variance_from_characteristic(), 0.001) == 2
     assert pytest.approx(m2.variance_from_characteristic(), 0.001) == 4
+    # first order expansion for small frequencies
+    u = np.array([1e-12, 1e-8])
+    np.testing.assert_allclose(
+        poisson.characteristic_exponent(1, u), -2j * u + u * u, rtol=1e-12
+    )
 
 
 def test_poisson_cdf_from_characteristic(poisson: PoissonProcess) -> None:
@@ -42,6 +53,21 @@ def test_poisson_cdf_from_characteristic(poisson: PoissonProcess) -> None:
     cdf1 = m.cdf(1.0 * np.arange(10))
     cdf2 = m.cdf_from_characteristic(10, frequency_n=128 * 8).y
     np.testing.assert_almost_equal(cdf1, cdf2, decimal=3)
+    cdf3 = m.cdf_from_characteristic(10, use_fft=True).y
+    np.testing.assert_allclose(cdf1, cdf3, rtol=1e-12)
+    m = poisson.marginal(100)
+    x = np.arange(300.0)
+    np.testing.assert_allclose(
+        m.cdf_from_characteristic(300, use_fft=True).y, m.cdf(x), atol=1e-14
+    )
+    t = np.array([0.1, 1.0, 10.0])
+    cdf4 = poisson.marginal(t).cdf_from_characteristic(30, use_fft=True).y
+    assert cdf4.shape == (3, 30)
+    np.testing.assert_allclose(cdf4, m.process.analytical_cdf(t[:, None], x[:30]))
+    # array horizons use the discrete Fourier transform by default
+    cdf5 = poisson.marginal(t).cdf_from_characteristic(30)
+    np.testing.assert_array_equal(cdf5.y, cdf4)
+    assert cdf5.x.dtype == m.cdf_from_characteristic(30).x.dtype == np.float64
     # TODO: fix this
     # np.testing.assert_almost_equal(pdf, c_pdf.y[:10])
 
@@ -56,6 +82,31 @@ def test_poisson_pdf(poisson: PoissonProcess) -> None:
     # np.testing.assert_almost_equal(pdf, c_pdf.y[:10])
 
 
+def test_poisson_analytical(poisson: PoissonProcess) -> None:
+    n = np.array([-1, 0, 0.5, 1, 2.7, 10, 200])
+    np.testing.assert_allclose(
+        poisson.analytical_pdf(1.5, n), poisson_dist.pmf(n, 3), rtol=1e-12
+    )
+    np.testing.assert_allclose(
+        poisson.analytical_cdf(1.5, n), poisson_dist.cdf(n, 3), rtol=1e-12
+    )
+    k = np.array([0, 3, 400])
+    np.testing.assert_allclose(
+        poisson.cdf_jacobian(1, k), [-poisson_dist.pmf(k, 2)], rtol=1e-12
+    )
+
+
+def test_poisson_pdf_at(poisson: PoissonProcess) -> None:
+    m = poisson.marginal(1)
+    n = np.array([0, 1, 5, 12])
+    np.testing.assert_almost_equal(m.pdf_at(n), m.pdf(n))
+    t = np.array([0.5, 1.0, 3.0])
+    pdf = poisson.marginal(t).pdf_at(n)
+    assert pdf.shape == (3, 4)
+    np.testing.assert_almost_equal(pdf, poisson.analytical_pdf(t[:, None], n))
+    assert m.pdf_at(5) == pytest.approx(m.pdf(5))
+
+
 def test_poisson_sampling(poisson: PoissonProcess) -> None:
     paths = poisson.sample(1000, time_horizon=1, time_steps=1000)
     mean = paths.mean()
@@ -85,6 +136,9 @@ def test_dsp_pdf(dsp: DSP):
     pdf1 = m.pdf_from_characteristic(32).y
     pdf2 = m.pdf_from_characteristic(64).y
     np.testing.assert_almost_equal(pdf2[:32], pdf1)
+    pdf = m.pdf_at(np.arange(64))
+    assert pytest.approx(pdf.sum()) == 1
+    assert pytest.approx(np.dot(np.arange(64), pdf), 1e-4) == m.mean()
 
 
 def test_compound_create_double_exponential():
@@ -99,3 +153,29 @@ def test_compound_create():
     assert poi.intensity == 20
     assert poi.analytical_mean(0.1) == 0
     assert poi.analytical_std(0.1) == 0.5 * np.sqrt(0.1)
+
+
+def test_dsp_arrivals_batch(dsp: DSP):
+    arrivals, counts = dsp.arrivals_batch(time_horizon=2, m=500)
+    assert counts.shape == (500,)
+    assert arrivals.shape == (counts.sum(),)
+    assert np.all((arrivals > 0) & (arrivals <= 2))
+    assert counts.mean() == pytest.approx(dsp.marginal(2).mean(), rel=0.2)
+
+
+def test_poisson_arrivals_batch():
+    arrivals, counts = poisson_arrivals_batch(2, 3, 1000)
+    assert counts.shape == (1000,)
+    assert arrivals.shape == (counts.sum(),)
+    assert pytest.approx(counts.mean(), 0.1) == 6
+    assert np.all((arrivals >= 0) & (arrivals <= 3))
+    for path in np.split(arrivals, np.cumsum(counts)[:-1]):
+        assert np.all(np.diff(path) >= 0)
+
+
+def test_poisson_arrivals():
+    arrivals = poisson_arrivals(500, 2)
+    assert isinstance(arrivals, np.ndarray)
+    assert pytest.approx(len(arrivals), 0.2) == 1000
+    assert 0 < arrivals[0] and arrivals[-1] <= 2
+    assert np.all(np.diff(arrivals) > 0)
@@ -38,3 +38,12 @@ def test_path_stats() -> None:
     assert paths.paths_mean().shape == (2,)
     assert paths.paths_std(scaled=True).shape == (2,)
     assert paths.paths_var(scaled=False).shape == (2,)
+
+
+def test_sobol_draws() -> None:
+    paths = Paths.sobol_draws(256, 1, 100, seed=42)
+    assert paths.samples == 256
+    assert paths.time_steps == 100
+    assert paths.data.flags.c_contiguous
+    np.testing.assert_allclose(paths.mean(), 0, atol=0.02)
+    np.testing.assert_allclose(paths.std(), 1, atol=0.05)